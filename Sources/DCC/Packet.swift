@@ -16,12 +16,15 @@ public protocol Packet : Packable {
 extension Packet {
     
     public func add<T : Packer>(into packer: inout T) {
+        // Accumulate the error detection byte in the same pass, since `bytes`
+        // may be computed and we don't want to pack it twice.
+        var errorDetectionByte: UInt8 = 0
         for byte in bytes {
             packer.add(0, length: 1)
             packer.add(byte, length: 8)
+            errorDetectionByte ^= byte
         }
-        
-        let errorDetectionByte = bytes.reduce(0, { $0 ^ $1 })
+
         packer.add(0, length: 1)
         packer.add(errorDetectionByte, length: 8)
         
@@ -56,9 +56,14 @@ public struct SignalPacker: Packer {
         // Convert each input bit; there's no shortcut here for counting
         // consecutive bits because we always have to output a block of
         // 1s and 0s for each one anyway.
+        //
+        // The pulse lengths are fixed for the whole call, so read them once
+        // rather than through `self` on every iteration of a mutating loop.
+        let zeroBitLength = timing.zeroBitLength
+        let oneBitLength = timing.oneBitLength
         for offset in 0..<length {
             let bit = value >> (length - offset - 1) & 1
-            let pulseLength = bit == 0 ? timing.zeroBitLength : timing.oneBitLength
+            let pulseLength = bit == 0 ? zeroBitLength : oneBitLength
             
             add(pulseLength: pulseLength, high: true)
             add(pulseLength: pulseLength, high: false)